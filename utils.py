@@ -9,9 +9,72 @@ from datetime import datetime
 import os
 import pdb
 from pynput import keyboard
+from statistics import NormalDist
 import subprocess
 
 
+def estimateperformance(wins, played, guesses, squares, population, confidence=0.95, maxattempts=6):
+    """Estimate the win rate and mean number of guesses from a sample of games, with confidence intervals.
+
+    Games are assumed to be sampled without replacement from a finite population of secret words, so
+    both intervals shrink to zero once every word in the population has been played.
+
+    Parameters
+    ----------
+    wins : int
+        Number of games won so far.
+    played : int
+        Number of games played so far.
+    guesses : int
+        Total number of guesses used across all games that were won.
+    squares : int
+        Total of the squared number of guesses across all games that were won.
+    population : int
+        Number of secret words that could have been sampled (excluding any words whose games were skipped).
+    confidence : float, optional
+        Confidence level of the intervals. Default is 0.95.
+    maxattempts : int, optional
+        Maximum number of guesses allowed per game. Default is 6.
+
+    Returns
+    -------
+    winlow : float
+        Lower bound of the confidence interval for the win rate (Wilson score interval).
+    winhigh : float
+        Upper bound of the confidence interval for the win rate (Wilson score interval).
+    meanguess : float
+        Average number of guesses to solve, or nan if no games have been won.
+    guesslow : float
+        Lower bound of the confidence interval for the mean number of guesses, clipped to 1.
+    guesshigh : float
+        Upper bound of the confidence interval for the mean number of guesses, clipped to maxattempts.
+    """
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    fpc = ((population - played) / (population - 1)) ** 0.5 if population > 1 else 0  # finite population correction
+
+    # Win rate, using the Wilson score interval so the bounds stay inside [0, 1] and do not collapse
+    # when p is 0 or 1; the finite population correction enters through the effective sample size
+    winrate = wins / played
+    if fpc == 0:  # every word has been played, so the win rate is exact
+        winlow = winhigh = winrate
+    else:
+        n = played / fpc ** 2  # effective sample size
+        centre = (winrate + z ** 2 / (2 * n)) / (1 + z ** 2 / n)
+        halfwidth = z / (1 + z ** 2 / n) * (winrate * (1 - winrate) / n + z ** 2 / (4 * n ** 2)) ** 0.5
+        winlow, winhigh = max(centre - halfwidth, 0), min(centre + halfwidth, 1)
+
+    # Mean number of guesses (only counting games that were won)
+    if wins == 0:
+        return winlow, winhigh, float('nan'), 1, maxattempts
+    meanguess = guesses / wins
+    variance = max(squares - wins * meanguess ** 2, 0) / (wins - 1) if wins > 1 else 0
+    variance = max(variance, 0.25)  # floor at the variance of wins split evenly between two neighbouring outcomes
+    guesserror = z * (variance / wins) ** 0.5 * fpc
+    guesslow, guesshigh = max(meanguess - guesserror, 1), min(meanguess + guesserror, maxattempts)
+
+    return winlow, winhigh, meanguess, guesslow, guesshigh
+
+
 def getdailysecret():
     """Find the official word of the day using an encrypted list of secret words."""
     # Read words directly from file
@@ -179,6 +242,26 @@ def test():
     print(f'ADIEU --> DIALS = {getfeedback("ADIEU", "DIALS")}')
     print(f'ROBOT --> BOUND = {getfeedback("ROBOT", "BOUND")}')
 
+    print('\nESTIMATEPERFORMANCE')
+    print('-------------------')
+    winlow, winhigh, meanguess, guesslow, guesshigh = estimateperformance(0, 91, 0, 0, 2315)
+    print(f'0 of 91 won --> win rate [{winlow:0.3f}, {winhigh:0.3f}], guesses {meanguess} [{guesslow}, {guesshigh}]')
+    assert winlow == 0 and 0 < winhigh < 0.05 and guesslow == 1 and guesshigh == 6
+    winlow, winhigh, meanguess, guesslow, guesshigh = estimateperformance(91, 91, 364, 1456, 2315)
+    print(f'91 of 91 won in 4 --> win rate [{winlow:0.3f}, {winhigh:0.3f}], guesses {meanguess} [{guesslow:0.3f}, {guesshigh:0.3f}]')
+    assert 0.95 < winlow < winhigh == 1 and guesslow < meanguess < guesshigh
+    same = estimateperformance(2, 2, 4, 8, 2315)  # wins in 2 and 2 guesses
+    diff = estimateperformance(2, 2, 5, 13, 2315)  # wins in 2 and 3 guesses
+    print(f'2,2 guesses --> [{same[3]:0.3f}, {same[4]:0.3f}]; 2,3 guesses --> [{diff[3]:0.3f}, {diff[4]:0.3f}]')
+    assert same[4] - same[3] <= diff[4] - diff[3] and same[3] >= 1
+    winlow, winhigh, meanguess, guesslow, guesshigh = estimateperformance(5, 10, 20, 80, 10)
+    print(f'all 10 words played --> win rate [{winlow}, {winhigh}], guesses {meanguess} [{guesslow}, {guesshigh}]')
+    assert winlow == winhigh == 0.5 and guesslow == guesshigh == 4
+    played, scored = 2315, 2305  # 10 games skipped because of invalid guesses
+    winlow, winhigh, meanguess, guesslow, guesshigh = estimateperformance(10, scored, 20, 40, 2315 - (played - scored))
+    print(f'all words drawn, 10 skipped --> win rate [{winlow:0.4f}, {winhigh:0.4f}], guesses {meanguess} [{guesslow}, {guesshigh}]')
+    assert winlow == winhigh == 10 / scored and guesslow == guesshigh == 2
+
     print('\nGETKEY')
     print('Press any key...')
     key = getkey()
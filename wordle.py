@@ -21,6 +21,7 @@ ALLWORDS = os.path.join(ROOT, "allwords5.txt")
 MAXATTEMPTS = 6  # how many total guesses are allowed?
 NUMLETTERS = 5  # how many letters in the word?
 ALPHABET = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'  # valid letters to guess
+MINGAMES = 30  # fewest games to play before an evaluation is allowed to stop early
 
 parser = argparse.ArgumentParser(description="Play Wordle in Python!")
 parser.add_argument('-ai', metavar='filename', type=str, help='name of AI file containing makeguess function')
@@ -33,6 +34,10 @@ parser.add_argument('--superfast', action='store_true', help='flag to eliminate
 parser.add_argument('--playall', action='store_true', help="flag to play all possible secret words")
 parser.add_argument('--practice', action='store_true', help='flag to not track stats for this game')
 parser.add_argument('--daily', action='store_true', help="flag to play today's Wordle")
+parser.add_argument('--evaluate', action='store_true', help='flag to sample secret words without replacement until the performance estimates are precise enough, ignoring games ended by an invalid guess (AI only)')
+parser.add_argument('--precision', metavar='p', type=float, help='target half-width of the win rate confidence interval when evaluating, defaults to 0.02', default=0.02)
+parser.add_argument('--guessprecision', metavar='g', type=float, help='target half-width of the mean guesses confidence interval when evaluating (checked once MINGAMES games are won), defaults to 0.05', default=0.05)
+parser.add_argument('--confidence', metavar='c', type=float, help='confidence level of the intervals when evaluating, defaults to 0.95', default=0.95)
 parser.add_argument('--showfails', action='store_true', help='flag to display the secret words that were missed after all games are complete')
 parser.add_argument('--version', action='version', version=utils.getversion())
 
@@ -58,6 +63,14 @@ def main(args):
     if args.playall and (args.daily or args.n > 1):
         print(Fore.RED + f'ERROR: Invalid set of input arguments. Cannot set -n or --daily if using --playall.')
         return 0
+
+    if args.evaluate and (args.ai is None or args.secret is not None or args.daily or args.playall or args.n > 1):
+        print(Fore.RED + f'ERROR: Invalid set of input arguments. Must set -ai and cannot set -n, --secret, --daily, or --playall if using --evaluate.')
+        return 0
+
+    if args.evaluate and (not 0 < args.confidence < 1 or args.precision <= 0 or args.guessprecision <= 0):
+        print(Fore.RED + f'ERROR: Invalid input argument for --evaluate. Precisions must be positive and confidence must be between 0 and 1.')
+        return 0
     
     # Load AI player (if provided)
     ai = args.ai
@@ -81,9 +94,13 @@ def main(args):
 
     # Play the game
     failures = []  # keep track of which secret words were missed
-    if args.playall:
+    if args.playall or args.evaluate:
         args.n = len(secretwordlist)
-    for i in tqdm(range(args.n)) if args.superfast else range(args.n):
+    if args.evaluate:
+        sample = random.sample(secretwordlist, len(secretwordlist))  # random order without replacement
+        scored, wins, guesses, squares = 0, 0, 0, 0  # running totals for streaming estimates
+    progress = tqdm(range(args.n)) if args.superfast else range(args.n)
+    for i in progress:
         # Set the secret word
         if args.secret is not None:  # use the word provided by the user
             secret = args.secret.upper()
@@ -91,6 +108,8 @@ def main(args):
             secret = utils.getdailysecret()
         elif args.playall:  # iterate through the entire secret word list
             secret = secretwordlist[i]
+        elif args.evaluate:  # draw the next word from the shuffled list
+            secret = sample[i]
         else:  # pick randomly
             secret = random.choice(secretwordlist)
         
@@ -108,6 +127,42 @@ def main(args):
         if outcome != -1 and not args.practice:  # only update if user didn't quit
             utils.updatestats(outcome, filename=args.stats)
 
+        # Update estimates and stop once they are precise enough
+        if args.evaluate:
+            played = i + 1
+            if outcome == -1:  # skip invalid guesses, just like the stats file
+                continue
+            scored += 1
+            if outcome > 0:
+                wins += 1
+                guesses += outcome
+                squares += outcome ** 2
+            population = len(secretwordlist) - (played - scored)  # skipped games use up words too
+            estimates = utils.estimateperformance(wins, scored, guesses, squares, population, args.confidence, MAXATTEMPTS)
+            winlow, winhigh, meanguess, guesslow, guesshigh = estimates
+            if args.superfast:
+                progress.set_postfix_str(f'win={wins / scored:0.1%} [{winlow:0.1%}, {winhigh:0.1%}], guesses={meanguess:0.2f} [{guesslow:0.2f}, {guesshigh:0.2f}]')
+            else:
+                print(f'Game {played}: win rate {wins / scored:0.1%} [{winlow:0.1%}, {winhigh:0.1%}], mean guesses {meanguess:0.2f} [{guesslow:0.2f}, {guesshigh:0.2f}]')
+            if scored >= MINGAMES and (winhigh - winlow) / 2 <= args.precision:
+                if wins < MINGAMES or (guesshigh - guesslow) / 2 <= args.guessprecision:  # too few wins to judge guesses
+                    break
+
+    if args.superfast:
+        progress.close()
+
+    # Show evaluation report, if requested
+    if args.evaluate:
+        print("\nEVALUATION")
+        print("=" * 10)
+        print(f"Games Needed: {played} of {len(secretwordlist)}")
+        if scored == 0:  # every game ended with an invalid guess
+            print(Fore.YELLOW + "WARNING: No valid games were played, so performance cannot be estimated.")
+        else:
+            print(f"Win Rate: {wins / scored:0.1%} [{winlow:0.1%}, {winhigh:0.1%}] ({args.confidence:0.0%} confidence)")
+        if wins > 0:  # the player has won at least one game
+            print(f"Average Number of Guesses to Solve: {meanguess:0.2f} [{guesslow:0.2f}, {guesshigh:0.2f}] ({args.confidence:0.0%} confidence)")
+
     # Show updated stats if not practicing
     if not args.practice:
         check_stats.main(args.stats)